@@ -9,13 +9,17 @@ This backend is built exclusively using LangChain framework with:
 """
 
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional
+import asyncio
+import json
 import os
 from dotenv import load_dotenv
 
 from app.services.travel_agent import TravelAgent
 from app.services.session_manager import SessionManager
+from app.tools.weather_info import LookupCache, use_lookup_cache
 
 # Load environment variables
 load_dotenv()
@@ -30,6 +34,24 @@ app = FastAPI(
 session_manager = SessionManager()
 travel_agent = TravelAgent()
 
+@app.on_event("startup")
+async def restore_sessions():
+    """Index sessions from the last snapshot; each is restored on first use"""
+    try:
+        count = session_manager.load_snapshot_index()
+        print(f"✅ Indexed {count} sessions from snapshot")
+    except Exception as e:
+        print(f"⚠️ Could not load session snapshot: {e}")
+
+@app.on_event("shutdown")
+async def snapshot_sessions():
+    """Write all sessions to the snapshot file on graceful shutdown"""
+    try:
+        count = session_manager.save_snapshot()
+        print(f"✅ Saved {count} sessions to snapshot")
+    except Exception as e:
+        print(f"⚠️ Could not save session snapshot: {e}")
+
 class ChatRequest(BaseModel):
     message: str
     session_id: str
@@ -39,6 +61,20 @@ class ChatResponse(BaseModel):
     session_id: str
     conversation_summary: Optional[str] = None
 
+# Upper bound for batch parallelism
+BATCH_CONCURRENCY_LIMIT = 32
+
+class BatchChatRequest(BaseModel):
+    items: List[ChatRequest] = Field(..., min_length=1)
+    max_concurrency: Optional[int] = Field(None, ge=1, le=BATCH_CONCURRENCY_LIMIT)
+
+# Default number of batch items processed in parallel, clamped to 1..BATCH_CONCURRENCY_LIMIT
+BATCH_MAX_CONCURRENCY = min(max(int(os.getenv("BATCH_MAX_CONCURRENCY", "4")), 1), BATCH_CONCURRENCY_LIMIT)
+
+def get_summary(memory) -> Optional[str]:
+    """Get the conversation summary from memory if available"""
+    return memory.chat_memory.get_summary() if hasattr(memory.chat_memory, 'get_summary') else None
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest):
     """
@@ -62,7 +98,7 @@ async def chat_endpoint(request: ChatRequest):
         )
         
         # Get conversation summary if available
-        summary = memory.chat_memory.get_summary() if hasattr(memory.chat_memory, 'get_summary') else None
+        summary = get_summary(memory)
         
         return ChatResponse(
             response=response,
@@ -73,6 +109,67 @@ async def chat_endpoint(request: ChatRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing message: {str(e)}")
 
+@app.post("/chat/batch")
+async def chat_batch_endpoint(request: BatchChatRequest):
+    """
+    Batch chat endpoint for bulk offline question processing
+    
+    Features:
+    - Items run concurrently up to max_concurrency (default BATCH_MAX_CONCURRENCY)
+    - Items for the same session run in submission order
+    - Weather geocode and forecast lookups are shared across the batch
+    - Results stream back as NDJSON, one line per item as it completes
+    """
+    semaphore = asyncio.Semaphore(request.max_concurrency or BATCH_MAX_CONCURRENCY)
+    lookup_cache = LookupCache()
+    results: asyncio.Queue = asyncio.Queue()
+    
+    # Group items by session, keeping their position in the batch
+    session_items: Dict[str, List[tuple]] = {}
+    for index, item in enumerate(request.items):
+        session_items.setdefault(item.session_id, []).append((index, item))
+    
+    async def run_session(session_id: str, items: List[tuple]):
+        # Each task runs in its own context, so this only affects this batch
+        use_lookup_cache(lookup_cache)
+        memory = None
+        
+        for index, item in items:
+            try:
+                if memory is None:
+                    memory = session_manager.get_memory(session_id)
+                async with semaphore:
+                    response = await travel_agent.process_message(
+                        message=item.message,
+                        memory=memory,
+                        session_id=session_id
+                    )
+                result = ChatResponse(
+                    response=response,
+                    session_id=session_id,
+                    conversation_summary=get_summary(memory)
+                ).model_dump()
+            except Exception as e:
+                result = {"session_id": session_id, "error": f"Error processing message: {str(e)}"}
+            
+            await results.put({"index": index, **result})
+    
+    async def stream_results():
+        tasks = [
+            asyncio.create_task(run_session(session_id, items))
+            for session_id, items in session_items.items()
+        ]
+        try:
+            for _ in range(len(request.items)):
+                result = await results.get()
+                yield json.dumps(result) + "\n"
+        finally:
+            # Stop outstanding work if the client disconnects early
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -83,7 +180,7 @@ async def get_session_summary(session_id: str):
     """Get conversation summary for a session"""
     try:
         memory = session_manager.get_memory(session_id)
-        summary = memory.chat_memory.get_summary() if hasattr(memory.chat_memory, 'get_summary') else None
+        summary = get_summary(memory)
         
         return {
             "session_id": session_id,
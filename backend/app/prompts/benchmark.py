@@ -0,0 +1,158 @@
+"""
+Prompt Profile Benchmark
+
+Reports the token cost of each prompt profile and the end-to-end latency of
+the real tool-calling agent (built exactly as TravelAgent builds it) running
+against a fake chat model, so the default profile can be chosen deliberately.
+
+Two kinds of numbers are reported:
+- measured: wall-clock time of AgentExecutor.invoke with the fake model,
+  i.e. the framework and prompt formatting overhead of each profile
+- estimated: a derived prefill cost of input tokens x --prefill-ms-per-1k,
+  which is not measured and stands in for the real model's prefill latency
+
+Usage (from the backend directory):
+    python -m app.prompts.benchmark
+    python -m app.prompts.benchmark --iterations 50 --prefill-ms-per-1k 40
+    python -m app.prompts.benchmark --gemini   # exact Gemini token counts
+"""
+
+import argparse
+import itertools
+import math
+import os
+import statistics
+import time
+from typing import Callable, Dict
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.prompts.travel_prompts import PROMPT_PROFILES, DEFAULT_PROMPT_PROFILE
+from app.services.travel_agent import create_agent_executor, get_agent_prompt
+from app.tools.weather_info import WEATHER_TOOLS
+
+# Sample conversation used for every benchmark run
+SAMPLE_HISTORY = [
+    HumanMessage(content="I'm thinking about a trip to Japan next spring."),
+    AIMessage(content="Great choice! 🌸 Spring is cherry blossom season. How many days are you planning to stay?"),
+]
+SAMPLE_INPUT = "About ten days. What should I pack for Tokyo in March?"
+
+
+class FakeToolCallingChatModel(GenericFakeChatModel):
+    """Fake chat model that accepts tool binding, so it can drive the real agent"""
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+def approximate_token_count(text: str) -> int:
+    """Count tokens with tiktoken when available, otherwise ~4 characters per token"""
+    try:
+        import tiktoken
+        return len(tiktoken.get_encoding("cl100k_base").encode(text))
+    except ImportError:
+        return math.ceil(len(text) / 4)
+
+
+def gemini_token_counter() -> Callable[[str], int]:
+    """Build a token counter backed by the Gemini count_tokens API"""
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    llm = ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        google_api_key=os.getenv("GEMINI_API_KEY"),
+    )
+    return llm.get_num_tokens
+
+
+def positive_int(value: str) -> int:
+    """argparse type for integers of at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def count_input_tokens(profile: str, count_tokens: Callable[[str], int]) -> int:
+    """Count the tokens of the full first-turn input the agent sends to the model"""
+    messages = get_agent_prompt(profile).format_messages(
+        input=SAMPLE_INPUT,
+        chat_history=SAMPLE_HISTORY,
+        agent_scratchpad=[],
+    )
+    return sum(count_tokens(str(message.content)) for message in messages)
+
+
+def benchmark_profile(profile: str, count_tokens: Callable[[str], int],
+                      iterations: int, prefill_ms_per_1k: float) -> Dict[str, float]:
+    """
+    Benchmark a single prompt profile
+
+    Returns:
+        Dictionary with the system prompt and input token counts, the measured
+        median agent latency (ms) and the estimated prefill cost (ms)
+    """
+    # Token counts are computed once, outside the timed region
+    system_tokens = count_tokens(PROMPT_PROFILES[profile])
+    input_tokens = count_input_tokens(profile, count_tokens)
+
+    llm = FakeToolCallingChatModel(
+        messages=itertools.repeat(AIMessage(content="Pack layers and a light rain jacket! 🧥"))
+    )
+    agent = create_agent_executor(llm, WEATHER_TOOLS, profile, verbose=False)
+    inputs = {
+        "input": SAMPLE_INPUT,
+        "chat_history": SAMPLE_HISTORY,
+    }
+
+    # Warm up once so one-time setup is not part of the measurement
+    agent.invoke(inputs)
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        agent.invoke(inputs)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "system_tokens": system_tokens,
+        "input_tokens": input_tokens,
+        "measured_ms": statistics.median(timings),
+        "estimated_prefill_ms": input_tokens * prefill_ms_per_1k / 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare system prompt profiles")
+    parser.add_argument("--iterations", type=positive_int, default=20, help="Runs per profile (default 20)")
+    parser.add_argument("--prefill-ms-per-1k", type=float, default=30.0,
+                        help="Assumed prefill latency per 1k input tokens for the estimate (default 30ms)")
+    parser.add_argument("--gemini", action="store_true",
+                        help="Count tokens with the Gemini API (requires GEMINI_API_KEY)")
+    args = parser.parse_args()
+
+    count_tokens = gemini_token_counter() if args.gemini else approximate_token_count
+
+    results = {
+        profile: benchmark_profile(profile, count_tokens, args.iterations, args.prefill_ms_per_1k)
+        for profile in PROMPT_PROFILES
+    }
+    baseline = results[DEFAULT_PROMPT_PROFILE]
+
+    print(f"{'profile':<10}{'system tok':>12}{'input tok':>11}"
+          f"{'measured ms':>13}{'delta ms':>10}{'est. prefill ms':>17}{'est. delta ms':>15}")
+    for profile, result in results.items():
+        marker = " (default)" if profile == DEFAULT_PROMPT_PROFILE else ""
+        measured_delta = result["measured_ms"] - baseline["measured_ms"]
+        estimated_delta = result["estimated_prefill_ms"] - baseline["estimated_prefill_ms"]
+        print(f"{profile:<10}{result['system_tokens']:>12}{result['input_tokens']:>11}"
+              f"{result['measured_ms']:>13.2f}{measured_delta:>+10.2f}"
+              f"{result['estimated_prefill_ms']:>17.2f}{estimated_delta:>+15.2f}{marker}")
+    print(f"\nmeasured: AgentExecutor.invoke with a fake model (median of {args.iterations} runs)")
+    print(f"est.: derived as input tokens x {args.prefill_ms_per_1k}ms per 1k tokens, not measured")
+
+
+if __name__ == "__main__":
+    main()
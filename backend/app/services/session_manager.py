@@ -5,11 +5,21 @@ Manages conversation sessions using LangChain's ConversationSummaryBufferMemory
 with intelligent conversation context management and memory optimization.
 """
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from langchain.memory import ConversationSummaryBufferMemory
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import SystemMessage
+from langchain_core.messages import SystemMessage, messages_from_dict, messages_to_dict
+import json
 import os
+import struct
+import zlib
+
+# Snapshot file layout: SNAPSHOT_MAGIC followed by appended records of
+#   [u32 session id length][session id][u32 payload length][zlib JSON payload]
+# A later record for the same session id replaces an earlier one.
+SNAPSHOT_MAGIC = b"TASNAP1\n"
+_ID_HEADER = struct.Struct(">I")
+_PAYLOAD_HEADER = struct.Struct(">I")
 
 class SessionManager:
     """
@@ -20,11 +30,17 @@ class SessionManager:
     - Automatic conversation summarization
     - Memory buffer optimization
     - Session isolation
+    - Snapshot on shutdown with lazy restore on first access
     """
     
-    def __init__(self):
+    def __init__(self, snapshot_path: Optional[str] = None):
         self.sessions: Dict[str, ConversationSummaryBufferMemory] = {}
         
+        # Snapshot file and the index of sessions in it not yet restored
+        # (session id -> payload offset and length)
+        self.snapshot_path = snapshot_path or os.getenv("SESSION_SNAPSHOT_PATH", "data/sessions.snapshot")
+        self.snapshot_index: Dict[str, Tuple[int, int]] = {}
+        
         # Initialize the LLM for memory summarization
         # Using a separate instance optimized for summarization
         self.summarizer_llm = ChatGoogleGenerativeAI(
@@ -55,6 +71,13 @@ class SessionManager:
                 output_key="output"
             )
             
+            # Restore history and summary from the snapshot on first access
+            if session_id in self.snapshot_index:
+                try:
+                    self._restore_memory(memory, self.snapshot_index.pop(session_id))
+                except Exception as e:
+                    print(f"⚠️ Could not restore session {session_id} from snapshot: {e}")
+            
             self.sessions[session_id] = memory
             
         return self.sessions[session_id]
@@ -69,10 +92,11 @@ class SessionManager:
         Returns:
             True if session was cleared, False if session didn't exist
         """
+        existed = self.snapshot_index.pop(session_id, None) is not None
         if session_id in self.sessions:
             del self.sessions[session_id]
             return True
-        return False
+        return existed
     
     def get_all_sessions(self) -> list:
         """
@@ -81,7 +105,7 @@ class SessionManager:
         Returns:
             List of active session IDs
         """
-        return list(self.sessions.keys())
+        return list(self.sessions.keys()) + list(self.snapshot_index.keys())
     
     def get_session_stats(self, session_id: str) -> dict:
         """
@@ -93,10 +117,10 @@ class SessionManager:
         Returns:
             Dictionary with session statistics
         """
-        if session_id not in self.sessions:
+        if session_id not in self.sessions and session_id not in self.snapshot_index:
             return {"error": "Session not found"}
         
-        memory = self.sessions[session_id]
+        memory = self.get_memory(session_id)
         messages = memory.chat_memory.messages
         
         return {
@@ -106,3 +130,126 @@ class SessionManager:
             "buffer_size": memory.max_token_limit,
             "memory_key": memory.memory_key
         }
+    
+    def load_snapshot_index(self) -> int:
+        """
+        Index the sessions stored in the snapshot file
+        
+        Only record headers are read; each session is deserialized lazily
+        on its first get_memory call.
+        
+        Returns:
+            Number of sessions found in the snapshot
+        """
+        self.snapshot_index = {}
+        if not os.path.exists(self.snapshot_path):
+            return 0
+        
+        with open(self.snapshot_path, "rb") as f:
+            if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                print(f"⚠️ Ignoring unrecognized session snapshot: {self.snapshot_path}")
+                return 0
+            
+            file_size = os.fstat(f.fileno()).st_size
+            
+            # A short read or undecodable id means a truncated trailing record
+            while True:
+                header = f.read(_ID_HEADER.size)
+                if len(header) < _ID_HEADER.size:
+                    break
+                id_length = _ID_HEADER.unpack(header)[0]
+                encoded_id = f.read(id_length)
+                if len(encoded_id) < id_length:
+                    break
+                try:
+                    session_id = encoded_id.decode("utf-8")
+                except UnicodeDecodeError:
+                    break
+                
+                header = f.read(_PAYLOAD_HEADER.size)
+                if len(header) < _PAYLOAD_HEADER.size:
+                    break
+                length = _PAYLOAD_HEADER.unpack(header)[0]
+                offset = f.tell()
+                if offset + length > file_size:
+                    break
+                f.seek(length, os.SEEK_CUR)
+                
+                # Skip live sessions so they are not overwritten
+                if session_id not in self.sessions:
+                    self.snapshot_index[session_id] = (offset, length)
+        
+        return len(self.snapshot_index)
+    
+    def save_snapshot(self) -> int:
+        """
+        Write every session's history and summary to the snapshot file
+        
+        Sessions that were never restored are copied over as raw bytes
+        without being deserialized. A session that fails to serialize is
+        skipped and logged so the rest are still written. The file is
+        replaced atomically.
+        
+        Returns:
+            Number of sessions written
+        """
+        directory = os.path.dirname(self.snapshot_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_path = self.snapshot_path + ".tmp"
+        written = 0
+        try:
+            with open(tmp_path, "wb") as out:
+                out.write(SNAPSHOT_MAGIC)
+                
+                if self.snapshot_index:
+                    with open(self.snapshot_path, "rb") as f:
+                        for session_id, (offset, length) in self.snapshot_index.items():
+                            f.seek(offset)
+                            out.write(self._encode_record(session_id, f.read(length)))
+                            written += 1
+                
+                for session_id, memory in self.sessions.items():
+                    try:
+                        payload = zlib.compress(json.dumps({
+                            "messages": messages_to_dict(memory.chat_memory.messages),
+                            "summary": memory.moving_summary_buffer,
+                        }).encode("utf-8"))
+                        record = self._encode_record(session_id, payload)
+                    except Exception as e:
+                        print(f"⚠️ Skipping session {session_id[:64]} in snapshot: {e}")
+                        continue
+                    out.write(record)
+                    written += 1
+            
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        # Offsets into the old file are no longer valid
+        self.load_snapshot_index()
+        return written
+    
+    def _restore_memory(self, memory: ConversationSummaryBufferMemory, location: Tuple[int, int]):
+        """Load a session's history and summary from the snapshot into memory"""
+        offset, length = location
+        with open(self.snapshot_path, "rb") as f:
+            f.seek(offset)
+            data = json.loads(zlib.decompress(f.read(length)).decode("utf-8"))
+        
+        memory.chat_memory.messages = messages_from_dict(data["messages"])
+        memory.moving_summary_buffer = data.get("summary") or ""
+    
+    @staticmethod
+    def _encode_record(session_id: str, payload: bytes) -> bytes:
+        """Encode a single session record for the snapshot file"""
+        encoded_id = session_id.encode("utf-8")
+        return b"".join([
+            _ID_HEADER.pack(len(encoded_id)),
+            encoded_id,
+            _PAYLOAD_HEADER.pack(len(payload)),
+            payload,
+        ])
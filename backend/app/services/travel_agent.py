@@ -10,7 +10,8 @@ A sophisticated travel assistant that uses:
 
 import os
 import asyncio
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 import requests
 from datetime import datetime
 
@@ -28,12 +29,76 @@ try:
 except ImportError:
     GenAITool = None
 from app.prompts.travel_prompts import (
-    TRAVEL_AGENT_SYSTEM_PROMPT,
+    PROMPT_PROFILES,
+    DEFAULT_PROMPT_PROFILE,
     ERROR_MESSAGES,
     CONVERSATION_STARTERS
 )
 from app.tools.weather_info import WEATHER_TOOLS
 
+
+def resolve_prompt_profile(profile: Optional[str] = None) -> str:
+    """
+    Resolve the system prompt profile name
+
+    Falls back to the PROMPT_PROFILE environment variable and then to the
+    default profile.
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    name = (profile or os.getenv("PROMPT_PROFILE") or DEFAULT_PROMPT_PROFILE).strip().lower()
+    if name not in PROMPT_PROFILES:
+        raise ValueError(
+            f"Unknown prompt profile '{name}'. Available profiles: {', '.join(PROMPT_PROFILES)}"
+        )
+    return name
+
+
+@lru_cache(maxsize=None)
+def get_agent_prompt(profile: str) -> ChatPromptTemplate:
+    """
+    Get the precompiled agent prompt template for a profile
+
+    Templates are built once per profile and shared by every agent instance.
+    """
+    return ChatPromptTemplate.from_messages([
+        ("system", PROMPT_PROFILES[profile]),
+        MessagesPlaceholder("chat_history"),
+        ("human", "{input}"),
+        MessagesPlaceholder("agent_scratchpad"),
+    ])
+
+
+def create_agent_executor(llm, tools: List, prompt_profile: str, verbose: bool = True) -> AgentExecutor:
+    """
+    Create the tool-calling agent executor for a prompt profile
+
+    Args:
+        llm: Chat model with tool calling support
+        tools: Tools available to the agent
+        prompt_profile: Name of the system prompt profile
+        verbose: Whether the executor logs each step
+
+    Returns:
+        AgentExecutor wrapping the tool-calling agent
+    """
+    # Use the precompiled prompt template for the selected profile
+    prompt = get_agent_prompt(prompt_profile)
+    
+    # Create the tool-calling agent
+    agent = create_tool_calling_agent(llm, tools, prompt)
+    
+    # Create agent executor
+    return AgentExecutor(
+        agent=agent,
+        tools=tools,
+        verbose=verbose,
+        handle_parsing_errors=True,
+        max_iterations=3,
+    )
+
+
 class TravelAgent:
     """
     Advanced Travel Assistant powered by LangChain and Gemini 2.5 Flash
@@ -46,7 +111,12 @@ class TravelAgent:
     - Context-aware recommendations
     """
     
-    def __init__(self):
+    def __init__(self, prompt_profile: Optional[str] = None):
+        # Select the system prompt profile (full, compact or minimal)
+        self.prompt_profile = resolve_prompt_profile(prompt_profile)
+        self.system_prompt = PROMPT_PROFILES[self.prompt_profile]
+        self.system_message = SystemMessage(content=self.system_prompt)
+        
         # Initialize Gemini 2.5 Flash with optimized settings and Google Search grounding
         self.llm = ChatGoogleGenerativeAI(
             model="gemini-2.5-flash",
@@ -77,31 +147,7 @@ class TravelAgent:
     
     def _create_agent(self):
         """Create the LangChain agent with chain-of-thought prompting"""
-        
-        # Use the sophisticated system prompt from the prompts module
-        system_prompt = TRAVEL_AGENT_SYSTEM_PROMPT
-
-        # Create the prompt template
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            MessagesPlaceholder("chat_history"),
-            ("human", "{input}"),
-            MessagesPlaceholder("agent_scratchpad"),
-        ])
-        
-        # Create the tool-calling agent
-        agent = create_tool_calling_agent(self.llm_with_tools, self.tools, prompt)
-        
-        # Create agent executor
-        agent_executor = AgentExecutor(
-            agent=agent,
-            tools=self.tools,
-            verbose=True,
-            handle_parsing_errors=True,
-            max_iterations=3,
-        )
-        
-        return agent_executor
+        return create_agent_executor(self.llm_with_tools, self.tools, self.prompt_profile)
     
     async def process_message(self, message: str, memory: ConversationSummaryBufferMemory, session_id: str) -> str:
         """
@@ -132,7 +178,7 @@ class TravelAgent:
                     response = await asyncio.to_thread(
                         self.llm.invoke,
                         [
-                            SystemMessage(content=TRAVEL_AGENT_SYSTEM_PROMPT),
+                            self.system_message,
                             *chat_history,
                             HumanMessage(content=message)
                         ],
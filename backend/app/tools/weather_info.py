@@ -6,10 +6,76 @@ providing current weather and forecast data for travel destinations.
 """
 
 import os
+import threading
 import requests
+from contextvars import ContextVar
 from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 from langchain_core.tools import tool
 
+
+class LookupCache:
+    """
+    Shared cache for geocode and forecast lookups
+
+    Used by batch processing so that every item asking about the same
+    location reuses a single OpenWeather request. Only successful responses
+    are cached, and concurrent lookups for the same key wait for the first one.
+    """
+    
+    def __init__(self):
+        self._results: Dict[Tuple, Any] = {}
+        self._locks: Dict[Tuple, threading.Lock] = {}
+        self._guard = threading.Lock()
+    
+    def get_json(self, url: str, params: dict) -> Optional[Any]:
+        """
+        Fetch JSON from the API, reusing a cached response when available
+        
+        Returns:
+            Parsed JSON, or None if the request was not successful
+        """
+        # The API key is the same for every call, so keep it out of the key
+        key = (url, tuple(sorted((k, v) for k, v in params.items() if k != "appid")))
+        
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        
+        with lock:
+            if key in self._results:
+                return self._results[key]
+            
+            data = _request_json(url, params)
+            if data:
+                self._results[key] = data
+            return data
+
+
+# Lookup cache for the current batch, if any (propagates into worker threads)
+_active_lookup_cache: ContextVar[Optional[LookupCache]] = ContextVar("weather_lookup_cache", default=None)
+
+
+def use_lookup_cache(cache: Optional[LookupCache]) -> None:
+    """Share a lookup cache with weather calls made from the current context"""
+    _active_lookup_cache.set(cache)
+
+
+def _request_json(url: str, params: dict) -> Optional[Any]:
+    """Perform a GET request and return its JSON body, or None on failure"""
+    response = requests.get(url, params=params, timeout=10)
+    if not response.ok:
+        return None
+    return response.json()
+
+
+def _get_json(url: str, params: dict) -> Optional[Any]:
+    """Fetch JSON through the active lookup cache when one is set"""
+    cache = _active_lookup_cache.get()
+    if cache is not None:
+        return cache.get_json(url, params)
+    return _request_json(url, params)
+
+
 @tool
 def get_weather_info(location: str, days: int = 3) -> str:
     """
@@ -30,12 +96,12 @@ def get_weather_info(location: str, days: int = 3) -> str:
         # Get coordinates first
         geo_url = f"http://api.openweathermap.org/geo/1.0/direct"
         geo_params = {"q": location, "limit": 1, "appid": api_key}
-        geo_response = requests.get(geo_url, params=geo_params, timeout=10)
+        geo_results = _get_json(geo_url, geo_params)
         
-        if not geo_response.ok or not geo_response.json():
+        if not geo_results:
             return f"Location '{location}' not found"
         
-        geo_data = geo_response.json()[0]
+        geo_data = geo_results[0]
         lat, lon = geo_data["lat"], geo_data["lon"]
         city_name = geo_data.get("name", location)
         country = geo_data.get("country", "")
@@ -48,13 +114,11 @@ def get_weather_info(location: str, days: int = 3) -> str:
             "appid": api_key,
             "units": "metric"
         }
-        weather_response = requests.get(weather_url, params=weather_params, timeout=10)
+        data = _get_json(weather_url, weather_params)
         
-        if not weather_response.ok:
+        if not data:
             return f"Weather data unavailable for {location}"
         
-        data = weather_response.json()
-        
         # Process current and forecast data
         current = data["list"][0]
         temp = current["main"]["temp"]
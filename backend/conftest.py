@@ -0,0 +1,4 @@
+import os
+
+# The Gemini clients are created at import time and only need a key to be set
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
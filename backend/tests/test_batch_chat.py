@@ -0,0 +1,111 @@
+"""
+Tests for the /chat/batch endpoint and shared weather lookups
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app import main
+from app.tools import weather_info
+from app.tools.weather_info import get_weather_info
+
+GEO_URL = "http://api.openweathermap.org/geo/1.0/direct"
+
+
+@pytest.fixture
+def weather_requests(monkeypatch):
+    """Stub the OpenWeather API and record every request made"""
+    calls = []
+
+    def fake_request_json(url, params):
+        calls.append((url, params.get("q"), params.get("lat")))
+        if url == GEO_URL:
+            return [{"lat": 41.9, "lon": 12.5, "name": params["q"], "country": "IT"}]
+        entry = {
+            "dt": 1760000000,
+            "main": {"temp": 20, "feels_like": 19, "humidity": 50},
+            "weather": [{"description": "clear sky"}],
+            "wind": {"speed": 3},
+        }
+        return {"list": [entry] * 8}
+
+    monkeypatch.setenv("OPENWEATHER_API_KEY", "test-key")
+    monkeypatch.setattr(weather_info, "_request_json", fake_request_json)
+    return calls
+
+
+@pytest.fixture
+def processed(monkeypatch):
+    """Stub the agent with one that checks the weather and records call order"""
+    calls = []
+
+    async def fake_process_message(message, memory, session_id):
+        # Vary the delay so sessions interleave differently from submission order
+        await asyncio.sleep(0.01 * (len(calls) % 3))
+        await asyncio.to_thread(get_weather_info.invoke, {"location": "Rome"})
+        calls.append((session_id, message))
+        return f"answer to {message}"
+
+    monkeypatch.setattr(main.travel_agent, "process_message", fake_process_message)
+    return calls
+
+
+async def run_batch(items, max_concurrency=None):
+    request = main.BatchChatRequest(
+        items=[main.ChatRequest(**item) for item in items],
+        max_concurrency=max_concurrency,
+    )
+    response = await main.chat_batch_endpoint(request)
+    lines = [chunk async for chunk in response.body_iterator]
+    for item in items:
+        main.session_manager.clear_session(item["session_id"])
+    return [json.loads(line) for line in lines]
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_per_session_order(weather_requests, processed):
+    items = [
+        {"session_id": f"batch-{session}", "message": f"{session}-{turn}"}
+        for turn in range(3)
+        for session in ("a", "b", "c")
+    ]
+
+    results = await run_batch(items, max_concurrency=2)
+
+    for session in ("a", "b", "c"):
+        session_id = f"batch-{session}"
+        expected = [f"{session}-{turn}" for turn in range(3)]
+        assert [m for s, m in processed if s == session_id] == expected
+        assert [r["response"] for r in results if r["session_id"] == session_id] == [
+            f"answer to {message}" for message in expected
+        ]
+
+
+@pytest.mark.asyncio
+async def test_batch_streams_one_line_per_item(weather_requests, processed):
+    items = [
+        {"session_id": f"batch-{index % 2}", "message": f"question {index}"}
+        for index in range(5)
+    ]
+
+    results = await run_batch(items)
+
+    assert sorted(result["index"] for result in results) == list(range(len(items)))
+    assert all("error" not in result for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_shares_weather_lookups(weather_requests, processed):
+    items = [
+        {"session_id": "batch-x", "message": "Weather in Rome?"},
+        {"session_id": "batch-y", "message": "Is Rome sunny?"},
+    ]
+
+    await run_batch(items)
+
+    geocodes = [call for call in weather_requests if call[0] == GEO_URL]
+    forecasts = [call for call in weather_requests if call[0] != GEO_URL]
+    assert len(geocodes) == 1
+    assert len(forecasts) == 1
@@ -0,0 +1,36 @@
+"""
+Tests for system prompt profile selection
+"""
+
+import pytest
+
+from app.prompts.travel_prompts import DEFAULT_PROMPT_PROFILE, TRAVEL_AGENT_MINIMAL_PROMPT
+from app.services.travel_agent import TravelAgent, get_agent_prompt, resolve_prompt_profile
+
+
+def test_default_profile(monkeypatch):
+    monkeypatch.delenv("PROMPT_PROFILE", raising=False)
+    assert resolve_prompt_profile() == DEFAULT_PROMPT_PROFILE
+
+
+def test_env_fallback_is_normalized(monkeypatch):
+    monkeypatch.setenv("PROMPT_PROFILE", "  Compact ")
+    assert resolve_prompt_profile() == "compact"
+    assert resolve_prompt_profile("MINIMAL") == "minimal"
+
+
+def test_unknown_profile_raises(monkeypatch):
+    monkeypatch.delenv("PROMPT_PROFILE", raising=False)
+    with pytest.raises(ValueError, match="Unknown prompt profile 'verbose'"):
+        resolve_prompt_profile("verbose")
+
+
+def test_agent_prompt_is_built_once():
+    assert get_agent_prompt("compact") is get_agent_prompt("compact")
+    assert get_agent_prompt("compact") is not get_agent_prompt("full")
+
+
+def test_agent_uses_selected_profile():
+    agent = TravelAgent(prompt_profile="minimal")
+    assert agent.prompt_profile == "minimal"
+    assert agent.system_message.content == TRAVEL_AGENT_MINIMAL_PROMPT
@@ -0,0 +1,162 @@
+"""
+Tests for SessionManager snapshot save and lazy restore
+"""
+
+import os
+
+import pytest
+
+from app.services import session_manager as session_manager_module
+from app.services.session_manager import SessionManager
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "sessions.snapshot")
+
+
+def add_turn(manager, session_id, user, ai):
+    memory = manager.get_memory(session_id)
+    memory.chat_memory.add_user_message(user)
+    memory.chat_memory.add_ai_message(ai)
+    return memory
+
+
+def contents(memory):
+    return [message.content for message in memory.chat_memory.messages]
+
+
+def save_two_sessions(snapshot_path):
+    manager = SessionManager(snapshot_path)
+    add_turn(manager, "a", "Hi", "Hello!")
+    memory = add_turn(manager, "b", "Weather in Rome?", "Sunny ☀️")
+    memory.moving_summary_buffer = "User asked about Rome"
+    assert manager.save_snapshot() == 2
+
+
+def test_round_trip_restores_lazily(snapshot_path):
+    save_two_sessions(snapshot_path)
+
+    manager = SessionManager(snapshot_path)
+    assert manager.load_snapshot_index() == 2
+    assert sorted(manager.get_all_sessions()) == ["a", "b"]
+    assert manager.sessions == {}
+
+    memory = manager.get_memory("b")
+    assert contents(memory) == ["Weather in Rome?", "Sunny ☀️"]
+    assert memory.moving_summary_buffer == "User asked about Rome"
+    assert list(manager.sessions) == ["b"]
+    assert list(manager.snapshot_index) == ["a"]
+
+
+def test_resave_keeps_sessions_never_restored(snapshot_path):
+    save_two_sessions(snapshot_path)
+
+    manager = SessionManager(snapshot_path)
+    manager.load_snapshot_index()
+    add_turn(manager, "b", "And tomorrow?", "Rain 🌧️")
+    add_turn(manager, "c", "Packing tips?", "Layers!")
+    assert manager.save_snapshot() == 3
+
+    restored = SessionManager(snapshot_path)
+    assert restored.load_snapshot_index() == 3
+    assert contents(restored.get_memory("a")) == ["Hi", "Hello!"]
+    assert contents(restored.get_memory("b")) == ["Weather in Rome?", "Sunny ☀️", "And tomorrow?", "Rain 🌧️"]
+    assert restored.get_memory("b").moving_summary_buffer == "User asked about Rome"
+    assert contents(restored.get_memory("c")) == ["Packing tips?", "Layers!"]
+
+
+def test_later_record_replaces_earlier(snapshot_path):
+    save_two_sessions(snapshot_path)
+
+    other = SessionManager(str(snapshot_path) + ".other")
+    add_turn(other, "a", "Replaced", "Yes")
+    other.save_snapshot()
+    with open(str(snapshot_path) + ".other", "rb") as f:
+        record = f.read()[len(session_manager_module.SNAPSHOT_MAGIC):]
+    with open(snapshot_path, "ab") as f:
+        f.write(record)
+
+    manager = SessionManager(snapshot_path)
+    assert manager.load_snapshot_index() == 2
+    assert contents(manager.get_memory("a")) == ["Replaced", "Yes"]
+
+
+def test_clear_session_not_yet_restored(snapshot_path):
+    save_two_sessions(snapshot_path)
+
+    manager = SessionManager(snapshot_path)
+    manager.load_snapshot_index()
+    assert manager.clear_session("a") is True
+    assert manager.get_all_sessions() == ["b"]
+    assert contents(manager.get_memory("a")) == []
+    manager.clear_session("a")
+    manager.save_snapshot()
+
+    restored = SessionManager(snapshot_path)
+    assert restored.load_snapshot_index() == 1
+    assert restored.get_all_sessions() == ["b"]
+
+
+@pytest.mark.parametrize("cut", [1, 3, 8, 20, 27])
+def test_truncated_file_keeps_complete_records(snapshot_path, cut):
+    manager = SessionManager(snapshot_path)
+    add_turn(manager, "a", "Hi", "Hello!")
+    add_turn(manager, "東京-session", "Tokyo?", "Great in spring 🌸")
+    manager.save_snapshot()
+
+    # Cut into the last record, including the middle of its multibyte id
+    index = SessionManager(snapshot_path)
+    index.load_snapshot_index()
+    last_record_start = index.snapshot_index["東京-session"][0] - 4 - len("東京-session".encode("utf-8")) - 4
+    with open(snapshot_path, "r+b") as f:
+        f.truncate(last_record_start + cut)
+
+    restored = SessionManager(snapshot_path)
+    assert restored.load_snapshot_index() == 1
+    assert contents(restored.get_memory("a")) == ["Hi", "Hello!"]
+
+
+def test_long_session_id_is_saved(snapshot_path):
+    long_id = "x" * 70000
+    manager = SessionManager(snapshot_path)
+    add_turn(manager, long_id, "Hi", "Hello!")
+    assert manager.save_snapshot() == 1
+
+    restored = SessionManager(snapshot_path)
+    assert restored.load_snapshot_index() == 1
+    assert contents(restored.get_memory(long_id)) == ["Hi", "Hello!"]
+
+
+def test_failed_session_is_skipped(snapshot_path, monkeypatch):
+    manager = SessionManager(snapshot_path)
+    add_turn(manager, "good", "Hi", "Hello!")
+    add_turn(manager, "bad", "boom", "!")
+
+    original = session_manager_module.messages_to_dict
+
+    def failing_messages_to_dict(messages):
+        if messages and messages[0].content == "boom":
+            raise ValueError("cannot serialize")
+        return original(messages)
+
+    monkeypatch.setattr(session_manager_module, "messages_to_dict", failing_messages_to_dict)
+    assert manager.save_snapshot() == 1
+    assert not os.path.exists(snapshot_path + ".tmp")
+
+    restored = SessionManager(snapshot_path)
+    assert restored.get_all_sessions() == [] and restored.load_snapshot_index() == 1
+    assert contents(restored.get_memory("good")) == ["Hi", "Hello!"]
+
+
+def test_failed_save_removes_temp_file(snapshot_path, monkeypatch):
+    manager = SessionManager(snapshot_path)
+    add_turn(manager, "a", "Hi", "Hello!")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(session_manager_module.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        manager.save_snapshot()
+    assert not os.path.exists(snapshot_path + ".tmp")
@@ -1,7 +1,19 @@
 import streamlit as st
 import requests
 import json
+import os
+import threading
+import time
 import uuid
+from requests.adapters import HTTPAdapter
+
+BACKEND_URL = os.getenv("BACKEND_URL", "http://backend:8000")
+
+# Number of messages shown before older ones are collapsed
+HISTORY_WINDOW = 20
+
+# (connect, read) timeouts for backend calls
+REQUEST_TIMEOUT = (5, 120)
 
 st.set_page_config(
     page_title="Travel Assistant",
@@ -9,6 +21,50 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource
+def get_backend_client() -> requests.Session:
+    """
+    Keep-alive HTTP session to the backend, shared across reruns
+    
+    Shared by every browser session, so it is used from several threads at
+    once; requests does not guarantee Session is thread-safe, but the calls
+    here only send requests and never change session state.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def send_message(client: requests.Session, message: str, session_id: str) -> dict:
+    """Send a chat message to the backend and return the response data"""
+    response = client.post(
+        f"{BACKEND_URL}/chat",
+        json={
+            "message": message,
+            "session_id": session_id
+        },
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+def run_in_thread(func, *args) -> tuple:
+    """Start func(*args) on its own thread, returning the thread and its outcome dict"""
+    outcome = {}
+    
+    def target():
+        try:
+            outcome["result"] = func(*args)
+        except Exception as e:
+            outcome["error"] = e
+    
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread, outcome
+
+backend = get_backend_client()
+
 st.title("✈️ Travel Assistant")
 st.markdown("Your intelligent travel companion powered by AI with conversation memory")
 
@@ -20,8 +76,19 @@ if "session_id" not in st.session_state:
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-# Display chat messages from history on app rerun
-for message in st.session_state.messages:
+# Number of recent messages to display
+if "history_window" not in st.session_state:
+    st.session_state.history_window = HISTORY_WINDOW
+
+# Older messages stay hidden until requested, so reruns only redraw the window
+hidden_count = max(0, len(st.session_state.messages) - st.session_state.history_window)
+if hidden_count:
+    if st.button(f"⬆️ Load earlier messages ({hidden_count} hidden)"):
+        st.session_state.history_window += HISTORY_WINDOW
+        st.rerun()
+
+# Display recent chat messages from history on app rerun
+for message in st.session_state.messages[hidden_count:]:
     with st.chat_message(message["role"]):
         st.markdown(message["content"])
 
@@ -36,41 +103,42 @@ if prompt := st.chat_input("Ask me anything about travel!"):
     
     # Get response from backend
     with st.chat_message("assistant"):
-        with st.spinner("Thinking..."):
-            try:
-                # Call backend API with session ID
-                response = requests.post(
-                    "http://backend:8000/chat",
-                    json={
-                        "message": prompt,
-                        "session_id": st.session_state.session_id
-                    },
-                    timeout=30
-                )
-                response.raise_for_status()
-                
-                response_data = response.json()
-                assistant_response = response_data["response"]
-                
-                # Update session ID if returned (shouldn't change but good practice)
-                if "session_id" in response_data:
-                    st.session_state.session_id = response_data["session_id"]
-                
-                st.markdown(assistant_response)
-                
-                # Add assistant response to chat history
-                st.session_state.messages.append({
-                    "role": "assistant", 
-                    "content": assistant_response
-                })
-                
-            except requests.exceptions.RequestException as e:
-                error_msg = f"Sorry, I'm having trouble connecting to my brain 🧠. Error: {str(e)}"
-                st.error(error_msg)
-                st.session_state.messages.append({
-                    "role": "assistant", 
-                    "content": error_msg
-                })
+        status = st.status("Thinking...")
+        try:
+            # Call backend API in the background and report progress while waiting
+            start = time.monotonic()
+            thread, outcome = run_in_thread(send_message, backend, prompt, st.session_state.session_id)
+            while thread.is_alive():
+                elapsed = int(time.monotonic() - start)
+                status.update(label=f"Thinking... {elapsed}s")
+                thread.join(timeout=0.5)
+            
+            if "error" in outcome:
+                raise outcome["error"]
+            response_data = outcome["result"]
+            status.update(label=f"Answered in {time.monotonic() - start:.1f}s", state="complete")
+            assistant_response = response_data["response"]
+            
+            # Update session ID if returned (shouldn't change but good practice)
+            if "session_id" in response_data:
+                st.session_state.session_id = response_data["session_id"]
+            
+            st.markdown(assistant_response)
+            
+            # Add assistant response to chat history
+            st.session_state.messages.append({
+                "role": "assistant", 
+                "content": assistant_response
+            })
+            
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Sorry, I'm having trouble connecting to my brain 🧠. Error: {str(e)}"
+            status.update(label="Something went wrong", state="error")
+            st.error(error_msg)
+            st.session_state.messages.append({
+                "role": "assistant", 
+                "content": error_msg
+            })
 
 # Sidebar with information
 with st.sidebar:
@@ -93,11 +161,12 @@ with st.sidebar:
     if st.button("🔄 New Session", use_container_width=True):
         try:
             # Clear session on backend
-            requests.delete(f"http://backend:8000/sessions/{st.session_state.session_id}")
+            backend.delete(f"{BACKEND_URL}/sessions/{st.session_state.session_id}", timeout=REQUEST_TIMEOUT)
         except:
             pass  # Ignore errors when clearing backend session
         
         # Generate new session ID and clear frontend history
         st.session_state.session_id = str(uuid.uuid4())
         st.session_state.messages = []
+        st.session_state.history_window = HISTORY_WINDOW
         st.rerun()